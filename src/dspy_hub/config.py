@@ -3,18 +3,32 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 DEFAULT_REGISTRY_URL = "https://api.dspyhub.com/index.json"
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class Settings:
     """Runtime configuration for the CLI."""
 
     registry: str = DEFAULT_REGISTRY_URL
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
-    """Return default runtime settings."""
+    """Return default runtime settings.
+
+    The result is cached — every hub operation consults the settings, and
+    they do not change within a process. Use ``load_settings.cache_clear()``
+    to force a rebuild.
+    """
 
     return Settings()
+
+
+def reload_settings() -> Settings:
+    """Drop the cached settings and rebuild them."""
+
+    load_settings.cache_clear()
+    return load_settings()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import shutil
 from dataclasses import dataclass
+from http.client import HTTPException
 from pathlib import Path
 from typing import List
 
@@ -59,12 +61,28 @@ class Installer:
                 continue
 
             target_path.parent.mkdir(parents=True, exist_ok=True)
+            # Stream into a staging file and rename into place so a failed
+            # or truncated download never leaves partial content at the
+            # final target.
+            staging_path = target_path.with_name(f".{target_path.name}.partial")
             try:
-                data = self.repository.fetch_bytes(source)
-            except RegistryError as exc:
+                with self.repository.open_stream(source) as stream:
+                    with staging_path.open("wb") as output:
+                        shutil.copyfileobj(stream, output)
+                    # A sized HTTP body that ends early reads as EOF;
+                    # HTTPResponse.length tracks what the peer still owed.
+                    remaining = getattr(stream, "length", None)
+                if remaining:
+                    raise InstallationError(
+                        f"Download of '{source}' was truncated "
+                        f"({remaining} bytes missing)"
+                    )
+                staging_path.replace(target_path)
+            except (RegistryError, HTTPException, OSError) as exc:
                 raise InstallationError(str(exc)) from exc
+            finally:
+                staging_path.unlink(missing_ok=True)
 
-            target_path.write_bytes(data)
             installed_paths.append(target_path)
 
         return installed_paths
\ No newline at end of file
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import io
 import json
+import threading
 from dataclasses import dataclass
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import IO, Iterable, List, Sequence
 from urllib.parse import urljoin, urlparse
 from urllib.request import urlopen
 
@@ -75,6 +77,8 @@ class PackageRepository:
                 f"Unsupported registry scheme '{parsed.scheme}'. Supported schemes: http, https, file"
             )
 
+        self.is_remote = parsed.scheme in ("http", "https")
+
         if parsed.scheme in ("", "file"):
             index_path = parsed.path if parsed.scheme else index_location
             self._index_path = Path(index_path).expanduser().resolve()
@@ -82,16 +86,48 @@ class PackageRepository:
                 raise RegistryError(f"Registry index not found at {self._index_path}")
             self._base_path = self._index_path.parent
             self._fetcher = self._fetch_local
+            self._opener = self._open_local
             self._loader = self._load_local
         else:
             self._index_url = index_location
             self._base_url = index_location.rsplit("/", 1)[0] + "/"
+            self._host = parsed.netloc
+            self._connection_cls = (
+                HTTPSConnection if parsed.scheme == "https" else HTTPConnection
+            )
+            self._connections = threading.local()
+            self._open_connections: List[HTTPConnection] = []
+            self._connections_lock = threading.Lock()
             self._fetcher = self._fetch_remote
+            self._opener = self._open_remote
             self._loader = self._load_remote
 
         self._index_cache: dict | None = None
         self._packages_cache: List[Package] | None = None
 
+    def close(self) -> None:
+        """Close every keep-alive connection opened through this repository.
+
+        Connections are per-thread; worker threads from parallel fetches
+        cannot close their own once they exit, so the repository keeps track
+        of all of them and releases the sockets here.
+        """
+
+        lock = getattr(self, "_connections_lock", None)
+        if lock is None:
+            return
+        with lock:
+            open_connections, self._open_connections = self._open_connections, []
+        for connection in open_connections:
+            connection.close()
+        self._connections.connection = None
+
+    def __enter__(self) -> "PackageRepository":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     # ------------------------------------------------------------------
     # Loading and discovery helpers
     # ------------------------------------------------------------------
@@ -176,6 +212,17 @@ class PackageRepository:
             raise RegistryError("File entries must provide a relative path")
         return self._fetcher(relative_path)
 
+    def open_stream(self, relative_path: str) -> IO[bytes]:
+        """Open a readable binary stream for a registry file.
+
+        Callers are responsible for closing the returned stream. This avoids
+        buffering whole artefacts in memory when the content can be consumed
+        incrementally (e.g. hashing while downloading).
+        """
+        if not relative_path:
+            raise RegistryError("File entries must provide a relative path")
+        return self._opener(relative_path)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -214,10 +261,90 @@ class PackageRepository:
             raise RegistryError(f"Registry file not found: {relative_path}")
         return candidate.read_bytes()
 
+    def _open_local(self, relative_path: str) -> IO[bytes]:
+        candidate = (self._base_path / relative_path).resolve()
+        try:
+            candidate.relative_to(self._base_path.resolve())
+        except ValueError as exc:
+            raise RegistryError(
+                f"Refusing to fetch file outside of the registry root: {relative_path}"
+            ) from exc
+        if not candidate.is_file():
+            raise RegistryError(f"Registry file not found: {relative_path}")
+        return candidate.open("rb")
+
     def _fetch_remote(self, relative_path: str) -> bytes:
-        url = urljoin(self._base_url, relative_path)
+        response = self._open_remote(relative_path)
         try:
-            with urlopen(url) as response:
+            with response:
                 return response.read()
         except OSError as exc:
             raise RegistryError(f"Unable to download '{relative_path}': {exc}") from exc
+
+    def _open_remote(self, relative_path: str) -> IO[bytes]:
+        url = urljoin(self._base_url, relative_path)
+        parsed = urlparse(url)
+        if parsed.netloc != self._host:
+            # Absolute source URLs (e.g. CDN-hosted artefacts) cannot reuse
+            # the registry's keep-alive connection; fetch them directly.
+            try:
+                return urlopen(url)
+            except OSError as exc:
+                raise RegistryError(
+                    f"Unable to download '{relative_path}': {exc}"
+                ) from exc
+        path = f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
+
+        last_error: OSError | HTTPException | None = None
+        for _ in range(2):
+            connection = self._get_connection()
+            try:
+                connection.request("GET", path)
+                response = connection.getresponse()
+            except (HTTPException, OSError) as exc:
+                # A stale keep-alive socket surfaces here; retry once fresh.
+                self._discard_connection()
+                last_error = exc
+                continue
+
+            if 300 <= response.status < 400:
+                response.read()
+                location = response.getheader("location")
+                if not location:
+                    raise RegistryError(
+                        f"Unable to download '{relative_path}': redirect without a location"
+                    )
+                try:
+                    return urlopen(urljoin(url, location))
+                except OSError as exc:
+                    raise RegistryError(
+                        f"Unable to download '{relative_path}': {exc}"
+                    ) from exc
+            if response.status >= 400:
+                response.read()
+                raise RegistryError(
+                    f"Unable to download '{relative_path}': HTTP {response.status}"
+                )
+            return response
+
+        raise RegistryError(
+            f"Unable to download '{relative_path}': {last_error}"
+        ) from last_error
+
+    def _get_connection(self) -> HTTPConnection:
+        connection = getattr(self._connections, "connection", None)
+        if connection is None:
+            connection = self._connection_cls(self._host)
+            self._connections.connection = connection
+            with self._connections_lock:
+                self._open_connections.append(connection)
+        return connection
+
+    def _discard_connection(self) -> None:
+        connection = getattr(self._connections, "connection", None)
+        if connection is not None:
+            self._connections.connection = None
+            with self._connections_lock:
+                if connection in self._open_connections:
+                    self._open_connections.remove(connection)
+            connection.close()